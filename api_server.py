@@ -3,13 +3,20 @@ FastAPI Backend - Can be deployed to cloud services
 Proxies requests to Ollama server
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from typing import Optional, List, Literal
 import requests
 import os
+import uuid
+import json
+import logging
+from chat_search import ChatSearchIndex
+from embed_batcher import EmbeddingBatcher
 
 app = FastAPI(title="Ollama Chatbot API")
+logger = logging.getLogger(__name__)
 
 # CORS for Vercel frontend
 app.add_middleware(
@@ -21,17 +28,50 @@ app.add_middleware(
 )
 
 OLLAMA_URL = os.getenv("OLLAMA_API_URL", "http://localhost:11434")
+search_index = ChatSearchIndex(os.getenv("CHAT_INDEX_PATH", "chat_index.db"))
+
+
+def ollama_embed(model: str, texts: List[str]) -> List[List[float]]:
+    response = requests.post(
+        f"{OLLAMA_URL}/api/embed",
+        json={"model": model, "input": texts},
+        timeout=300
+    )
+    response.raise_for_status()
+    return response.json()["embeddings"]
+
+
+embed_batcher = EmbeddingBatcher(
+    ollama_embed,
+    batch_window=float(os.getenv("EMBED_BATCH_WINDOW_MS", "0")) / 1000,
+    max_batch_size=int(os.getenv("EMBED_MAX_BATCH_SIZE", "32")),
+    cache_size=int(os.getenv("EMBED_CACHE_SIZE", "10000"))
+)
 
 
 class ChatRequest(BaseModel):
     message: str
     model: str = "llama3.2:latest"
     history: list = []
+    conversation_id: Optional[str] = None
 
 
 class ChatResponse(BaseModel):
     message: str
     success: bool
+    conversation_id: str
+
+
+class EmbedRequest(BaseModel):
+    """
+    Single-text embedding request.
+
+    encoding_format "float" returns a JSON list trimmed to float32 precision;
+    "base64" returns little-endian float32 bytes, roughly a third of the size.
+    """
+    input: str
+    model: str = "nomic-embed-text"
+    encoding_format: Literal["float", "base64"] = "float"
 
 
 @app.get("/health")
@@ -67,12 +107,52 @@ def chat(request: ChatRequest):
         response.raise_for_status()
         
         result = response.json()
-        return ChatResponse(
-            message=result["message"]["content"],
-            success=True
-        )
+        assistant_message = result["message"]["content"]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    # Indexing is best-effort; a search index failure must not lose the reply
+    conversation_id = request.conversation_id or uuid.uuid4().hex
+    try:
+        search_index.add_messages(conversation_id, [
+            {"role": "user", "content": request.message},
+            {"role": "assistant", "content": assistant_message}
+        ])
+    except Exception:
+        logger.exception("Failed to index chat turn")
+    
+    return ChatResponse(
+        message=assistant_message,
+        success=True,
+        conversation_id=conversation_id
+    )
+
+
+@app.get("/search")
+def search(q: str, limit: int = Query(10, ge=1, le=100)):
+    try:
+        return {"results": search_index.search(q, limit=limit), "success": True}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/embed")
+def embed(request: EmbedRequest):
+    try:
+        embedding = embed_batcher.embed(request.input, request.model)
+    except TimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    # The embedding is pre-encoded as JSON; splice it in rather than re-serialising
+    return Response(
+        content=(
+            f'{{"embedding": {embedding.to_json(request.encoding_format)}, '
+            f'"model": {json.dumps(request.model)}, "success": true}}'
+        ),
+        media_type="application/json"
+    )
 
 
 if __name__ == "__main__":
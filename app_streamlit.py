@@ -6,13 +6,23 @@ Modern web-based interface for local LLM chat.
 import streamlit as st
 import os
 from ollama_backend import OllamaBackend
+from chat_search import ChatSearchIndex
+
+
+@st.cache_resource
+def get_search_index():
+    """Shared full-text index of past conversations."""
+    return ChatSearchIndex(os.getenv("CHAT_INDEX_PATH", "chat_index.db"))
 
 
 def init_session_state():
     """Initialize Streamlit session state."""
     if "backend" not in st.session_state:
         ollama_url = os.getenv("OLLAMA_API_URL", "http://localhost:11434")
-        st.session_state.backend = OllamaBackend(base_url=ollama_url)
+        st.session_state.backend = OllamaBackend(
+            base_url=ollama_url,
+            search_index=get_search_index()
+        )
     if "messages" not in st.session_state:
         st.session_state.messages = []
     if "models" not in st.session_state:
@@ -129,6 +139,19 @@ def main():
         
         st.markdown("---")
         
+        # Search past conversations
+        search_query = st.text_input("🔍 Search conversations", key="search_query")
+        if search_query:
+            results = get_search_index().search(search_query, limit=10)
+            if results:
+                for result in results:
+                    speaker = "👤" if result["role"] == "user" else "🤖"
+                    st.caption(f"{speaker} {result['snippet']}")
+            else:
+                st.info("No matches found")
+        
+        st.markdown("---")
+        
         # Info
         st.markdown("""
         ### 📖 Instructions
@@ -6,7 +6,9 @@ Clean, modern desktop interface for local LLM chat.
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import threading
+import os
 from ollama_backend import OllamaBackend
+from chat_search import ChatSearchIndex
 
 
 class ChatbotGUI:
@@ -19,7 +21,9 @@ class ChatbotGUI:
         self.root.configure(bg="#1e1e1e")
         
         # Initialize backend
-        self.backend = OllamaBackend()
+        self.backend = OllamaBackend(
+            search_index=ChatSearchIndex(os.getenv("CHAT_INDEX_PATH", "chat_index.db"))
+        )
         self.is_loading = False
         
         # Setup UI
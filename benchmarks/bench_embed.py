@@ -0,0 +1,89 @@
+"""
+Embedding batcher benchmark
+Measures /embed throughput versus batch window against a stand-in upstream.
+
+Each request runs EmbeddingBatcher.embed() and Embedding.to_json(), the same
+work the /embed endpoint does. The sweep covers several client concurrency
+levels, because the window only matters when requests arrive slower than
+the upstream can serve them.
+
+Usage:
+    python benchmarks/bench_embed.py
+"""
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from embed_batcher import EmbeddingBatcher
+
+CALL_OVERHEAD = 0.020   # Fixed cost per upstream call (seconds)
+PER_TEXT_COST = 0.001   # Marginal cost per text in a batch (seconds)
+DIMENSIONS = 768
+CLIENTS = [1, 4, 16, 64]
+REQUESTS_PER_CLIENT = 20
+WINDOWS_MS = [0, 2, 5, 10, 20]
+
+_rng = random.Random(0)
+VECTORS = [[_rng.gauss(0, 1) for _ in range(DIMENSIONS)] for _ in range(64)]
+
+
+def stand_in_upstream(model, texts):
+    """Simulates an Ollama embedding call: fixed overhead plus per-text cost."""
+    time.sleep(CALL_OVERHEAD + PER_TEXT_COST * len(texts))
+    return [VECTORS[i % len(VECTORS)] for i in range(len(texts))]
+
+
+def run(clients: int, window_ms: float, max_batch_size: int = 32):
+    calls = []
+
+    def upstream(model, texts):
+        calls.append(len(texts))
+        return stand_in_upstream(model, texts)
+
+    batcher = EmbeddingBatcher(upstream, batch_window=window_ms / 1000,
+                               max_batch_size=max_batch_size, cache_size=0)
+    requests = clients * REQUESTS_PER_CLIENT
+    latencies = []
+
+    def request(i):
+        start = time.perf_counter()
+        batcher.embed(f"text {i}", "bench").to_json("float")
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(request, range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "throughput": requests / elapsed,
+        "mean_batch": sum(calls) / len(calls),
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99)] * 1000,
+    }
+
+
+def report(clients, label, r):
+    print(f"{clients:>7} {label:>9} {r['throughput']:8.0f} {r['mean_batch']:7.1f} "
+          f"{r['p50_ms']:8.1f} {r['p99_ms']:8.1f}")
+
+
+def main():
+    print(f"upstream {CALL_OVERHEAD * 1000:.0f}ms + {PER_TEXT_COST * 1000:.0f}ms/text, "
+          f"{DIMENSIONS} dims, float encoding included")
+    print(f"{'clients':>7} {'window':>9} {'req/s':>8} {'batch':>7} {'p50 ms':>8} {'p99 ms':>8}")
+    for clients in CLIENTS:
+        report(clients, "unbatched", run(clients, 0, max_batch_size=1))
+        for window_ms in WINDOWS_MS:
+            report(clients, f"{window_ms}ms", run(clients, window_ms))
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Chat search benchmark
+Fills a ChatSearchIndex with synthetic messages and times search().
+
+Messages draw from a Zipf-like vocabulary (word k has weight 1/k), so the
+top words behave like stopwords that appear in most messages. "python"
+is also added to most messages to model a topic the user chats about a lot.
+
+Usage:
+    python benchmarks/bench_search.py [messages]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from itertools import accumulate
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from chat_search import ChatSearchIndex
+
+MESSAGES = 1_000_000
+WORDS_PER_MESSAGE = 30
+VOCABULARY = 50_000
+STOPWORDS = ["the", "a", "is", "to", "of", "and", "in", "it", "you", "that"]
+TOPIC_WORD = "python"
+TOPIC_RATE = 0.6
+BATCH = 10_000
+QUERIES = ["the", "python", "the python", "is it python", "w100", "w100 python",
+           "w20000", "missingterm"]
+REPEATS = 10
+
+
+def make_vocabulary():
+    words = STOPWORDS + [f"w{i}" for i in range(len(STOPWORDS), VOCABULARY)]
+    weights = list(accumulate(1 / (rank + 1) for rank in range(len(words))))
+    return words, weights
+
+
+def main():
+    messages = int(sys.argv[1]) if len(sys.argv) > 1 else MESSAGES
+    rng = random.Random(0)
+    words, cum_weights = make_vocabulary()
+
+    def make_message():
+        tokens = rng.choices(words, cum_weights=cum_weights, k=WORDS_PER_MESSAGE)
+        if rng.random() < TOPIC_RATE:
+            tokens[rng.randrange(len(tokens))] = TOPIC_WORD
+        return " ".join(tokens)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = ChatSearchIndex(os.path.join(tmp, "bench.db"))
+
+        start = time.perf_counter()
+        for offset in range(0, messages, BATCH):
+            index.add_messages(f"c{offset}", [
+                {"role": "user", "content": make_message()}
+                for _ in range(min(BATCH, messages - offset))
+            ])
+        elapsed = time.perf_counter() - start
+        print(f"Indexed {messages} messages in {elapsed:.1f}s "
+              f"({messages / elapsed:.0f} msg/s)")
+
+        print(f"{'query':>16} {'results':>8} {'p50 ms':>8} {'max ms':>8}")
+        for query in QUERIES:
+            timings = []
+            for _ in range(REPEATS):
+                start = time.perf_counter()
+                results = index.search(query, limit=10)
+                timings.append((time.perf_counter() - start) * 1000)
+            timings.sort()
+            print(f"{query:>16} {len(results):8d} {timings[len(timings) // 2]:8.2f} "
+                  f"{timings[-1]:8.2f}")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Chat Search Module
+Incrementally maintained full-text index over past conversations (SQLite FTS5).
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from typing import List, Dict
+
+
+# Words too common to narrow a search; dropped unless the query has nothing else
+STOPWORDS = frozenset("""
+    a an and are as at be but by do for from has have how i if in is it me my
+    no not of on or so that the this to was we what when where which who why
+    will with you your
+""".split())
+
+# Terms in more messages than this are too costly to score with bm25, which
+# reads a term's whole posting list; such queries return the newest matches
+COMMON_TERM_DOCS = 5000
+
+
+class ChatSearchIndex:
+    """Full-text index of chat turns, updated as each message is appended."""
+
+    def __init__(self, db_path: str = ":memory:"):
+        """
+        Open (or create) the search index.
+
+        Args:
+            db_path: SQLite database file, or ":memory:" for a throwaway index
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS messages USING fts5(
+                content,
+                conversation_id UNINDEXED,
+                role UNINDEXED,
+                created_at UNINDEXED,
+                tokenize = 'porter unicode61'
+            )
+            """
+        )
+        self._conn.commit()
+
+    def add_message(self, conversation_id: str, role: str, content: str):
+        """Index a single chat message."""
+        self.add_messages(conversation_id, [{"role": role, "content": content}])
+
+    def add_messages(self, conversation_id: str, messages: List[Dict[str, str]]):
+        """
+        Index several chat messages in one transaction.
+
+        Args:
+            conversation_id: Conversation the messages belong to
+            messages: Dicts with "role" and "content" keys
+        """
+        now = time.time()
+        rows = [
+            (m["content"], conversation_id, m["role"], now)
+            for m in messages
+            if m.get("content", "").strip()
+        ]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO messages (content, conversation_id, role, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows
+            )
+
+    def search(self, query: str, limit: int = 10) -> List[Dict]:
+        """
+        Search indexed messages, best matches first.
+
+        Args:
+            query: Free-text search terms (all terms must match)
+            limit: Maximum number of results (at least 1)
+
+        Returns:
+            List of dicts with conversation_id, role, snippet, created_at and score.
+            Queries containing a very common term are ordered newest first and
+            have a score of None.
+        """
+        terms = self._query_terms(query)
+        if not terms:
+            return []
+        match = " ".join(terms)
+        # SQLite treats a negative LIMIT as unbounded
+        limit = max(1, limit)
+        with self._lock:
+            if any(self._is_common(term) for term in terms):
+                order, score = "rowid DESC", "NULL"
+            else:
+                order, score = "rank", "rank"
+            rows = self._conn.execute(
+                f"""
+                SELECT conversation_id, role,
+                       snippet(messages, 0, '[', ']', '...', 12),
+                       created_at, {score}
+                FROM messages
+                WHERE messages MATCH ?
+                ORDER BY {order}
+                LIMIT ?
+                """,
+                (match, limit)
+            ).fetchall()
+        return [
+            {
+                "conversation_id": conversation_id,
+                "role": role,
+                "snippet": snippet,
+                "created_at": created_at,
+                "score": -rank if rank is not None else None
+            }
+            for conversation_id, role, snippet, created_at, rank in rows
+        ]
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _is_common(self, term: str) -> bool:
+        """Whether a quoted term matches more than COMMON_TERM_DOCS messages (bounded count)."""
+        count = self._conn.execute(
+            "SELECT count(*) FROM (SELECT rowid FROM messages WHERE messages MATCH ? LIMIT ?)",
+            (term, COMMON_TERM_DOCS + 1)
+        ).fetchone()[0]
+        return count > COMMON_TERM_DOCS
+
+    @staticmethod
+    def _query_terms(query: str) -> List[str]:
+        """Split free text into quoted FTS5 terms so user input can't break the syntax."""
+        terms = re.findall(r"\w+", query)
+        terms = [t for t in terms if t.lower() not in STOPWORDS] or terms
+        return [f'"{term}"' for term in terms]
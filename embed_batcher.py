@@ -0,0 +1,205 @@
+"""
+Embedding Batcher Module
+Collects concurrent single-text embedding requests into batched upstream calls.
+"""
+
+import base64
+import concurrent.futures
+import hashlib
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, List, Dict
+
+
+EmbedFn = Callable[[str, List[str]], List[List[float]]]
+
+logger = logging.getLogger(__name__)
+
+
+class Embedding:
+    """A float32 embedding whose JSON float list is rendered once and reused."""
+
+    __slots__ = ("vector", "_float_json")
+
+    def __init__(self, vector: array):
+        self.vector = vector
+        self._float_json = None
+
+    def to_json(self, encoding_format: str = "float") -> str:
+        """
+        Encode the embedding as a JSON value.
+
+        "float" gives a list with the shortest decimal form of each float32
+        value; "base64" gives little-endian float32 bytes, the most compact.
+        """
+        if encoding_format == "base64":
+            vector = self.vector
+            if sys.byteorder == "big":
+                vector = array("f", vector)
+                vector.byteswap()
+            return json.dumps(base64.b64encode(vector.tobytes()).decode("ascii"))
+        # Rendered in the caller's thread, off the batch worker's critical path;
+        # a race only means two threads compute the same string
+        if self._float_json is None:
+            self._float_json = json.dumps(_shortest_float32(self.vector))
+        return self._float_json
+
+
+class EmbeddingBatcher:
+    """Dynamic micro-batcher with a content-hash cache for embedding requests."""
+
+    def __init__(self, embed_fn: EmbedFn, batch_window: float = 0,
+                 max_batch_size: int = 32, cache_size: int = 10000,
+                 timeout: float = 300):
+        """
+        Initialize the batcher.
+
+        Args:
+            embed_fn: Called as embed_fn(model, texts) and returns one vector per text
+            batch_window: Seconds to wait for more requests after the first one arrives
+            max_batch_size: Maximum number of texts sent upstream in one call
+            cache_size: Maximum number of cached embeddings (0 disables caching)
+            timeout: Seconds a caller waits for its batch before giving up
+        """
+        self.embed_fn = embed_fn
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.cache_size = cache_size
+        self.timeout = timeout
+        self._cache: "OrderedDict[str, Embedding]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def embed(self, text: str, model: str) -> Embedding:
+        """
+        Embed a single text, blocking until its batch has been processed.
+
+        Args:
+            text: Input text
+            model: Embedding model name
+
+        Returns:
+            Embedding holding the float32 vector and its encoded forms
+        """
+        key = self._cache_key(model, text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        self._ensure_worker()
+        future: Future = Future()
+        self._queue.put((model, text, key, future))
+        try:
+            return future.result(timeout=self.timeout)
+        except concurrent.futures.TimeoutError:
+            raise TimeoutError(f"Embedding timed out after {self.timeout}s")
+
+    def _ensure_worker(self):
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._flush(batch)
+            except Exception as e:
+                # Never let the worker die; fail whatever is still pending
+                logger.exception("Embedding batch failed")
+                _fail([future for _, _, _, future in batch], e)
+
+    def _flush(self, batch):
+        # Group by model, de-duplicating identical texts within the batch
+        by_model: Dict[str, Dict[str, list]] = {}
+        for model, text, key, future in batch:
+            by_model.setdefault(model, {}).setdefault(key, [text]).append(future)
+
+        for model, pending in by_model.items():
+            keys = list(pending)
+            try:
+                vectors = self.embed_fn(model, [pending[k][0] for k in keys])
+                if len(vectors) != len(keys):
+                    raise Exception(f"Expected {len(keys)} embeddings, got {len(vectors)}")
+                compact = [Embedding(array("f", vector)) for vector in vectors]
+                for key, embedding in zip(keys, compact):
+                    self._cache_put(key, embedding)
+            except Exception as e:
+                _fail([f for k in keys for f in pending[k][1:]], e)
+                continue
+
+            for key, embedding in zip(keys, compact):
+                for future in pending[key][1:]:
+                    future.set_result(embedding)
+
+    @staticmethod
+    def _cache_key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str):
+        with self._cache_lock:
+            embedding = self._cache.get(key)
+            if embedding is not None:
+                self._cache.move_to_end(key)
+            return embedding
+
+    def _cache_put(self, key: str, embedding: Embedding):
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = embedding
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+
+def _fail(futures: List[Future], error: Exception):
+    """Fail pending futures, each with its own exception so tracebacks don't pile up."""
+    for future in futures:
+        if not future.done():
+            wrapped = RuntimeError(f"Embedding failed: {error}")
+            wrapped.__cause__ = error
+            future.set_exception(wrapped)
+
+
+def _shortest_float32(vector: array) -> List[float]:
+    """Shortest decimals that round-trip to the same float32 values."""
+    result = [0.0] * len(vector)
+    todo = range(len(vector))
+    # Format every remaining value at once per precision step; most finish early
+    for digits in (6, 7, 8):
+        values = [vector[i] for i in todo]
+        candidates = [float(t) for t in (f"%.{digits}g " * len(values) % tuple(values)).split()]
+        rounded = array("f", candidates)
+        remaining = []
+        for j, i in enumerate(todo):
+            if rounded[j] == values[j]:
+                result[i] = candidates[j]
+            else:
+                remaining.append(i)
+        todo = remaining
+        if not todo:
+            return result
+    for i in todo:
+        result[i] = float(f"{vector[i]:.9g}")
+    return result
@@ -3,23 +3,31 @@ Ollama Backend Module
 Handles communication with Ollama API and manages chat history.
 """
 
+import uuid
+import logging
 import requests
 from typing import List, Dict, Optional
 
+logger = logging.getLogger(__name__)
+
 
 class OllamaBackend:
     """Backend handler for Ollama LLM interactions."""
     
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = None):
+    def __init__(self, base_url: str = "http://localhost:11434", model: str = None,
+                 search_index=None):
         """
         Initialize Ollama backend.
         
         Args:
             base_url: Ollama API base URL
             model: Model name to use (auto-detected if None)
+            search_index: Optional ChatSearchIndex fed with every completed turn
         """
         self.base_url = base_url
         self.model = model
+        self.search_index = search_index
+        self.conversation_id = uuid.uuid4().hex
         self.chat_history: List[Dict[str, str]] = []
         
         # Auto-detect model if not specified
@@ -93,6 +101,13 @@ class OllamaBackend:
             # Add to history
             self.chat_history.append({"role": "assistant", "content": assistant_message})
             
+            # Index the completed turn for later search (best-effort)
+            if self.search_index is not None:
+                try:
+                    self.search_index.add_messages(self.conversation_id, self.chat_history[-2:])
+                except Exception:
+                    logger.exception("Failed to index chat turn")
+            
             return assistant_message
             
         except requests.exceptions.Timeout:
@@ -109,8 +124,9 @@ class OllamaBackend:
             raise Exception(f"Error: {error_msg}")
     
     def clear_history(self):
-        """Clear chat history."""
+        """Clear chat history and start a new conversation."""
         self.chat_history = []
+        self.conversation_id = uuid.uuid4().hex
     
     def get_history(self) -> List[Dict[str, str]]:
         """Get current chat history."""
@@ -0,0 +1,112 @@
+import base64
+import os
+import sqlite3
+import struct
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+os.environ.setdefault("CHAT_INDEX_PATH", ":memory:")
+
+from fastapi.testclient import TestClient
+import api_server
+from chat_search import ChatSearchIndex
+from embed_batcher import EmbeddingBatcher
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(api_server, "search_index", ChatSearchIndex())
+    return TestClient(api_server.app)
+
+
+@pytest.fixture
+def use_embedder(monkeypatch):
+    def install(embed_fn, **kwargs):
+        monkeypatch.setattr(api_server, "embed_batcher",
+                            EmbeddingBatcher(embed_fn, batch_window=0, **kwargs))
+    return install
+
+
+@pytest.fixture
+def mock_ollama():
+    with patch('api_server.requests.post') as mock_post:
+        mock_post.return_value.json.return_value = {
+            "message": {"content": "Paris is the capital."}
+        }
+        yield mock_post
+
+
+class TestChatEndpoint:
+    
+    def test_chat_returns_conversation_id(self, client, mock_ollama):
+        response = client.post("/chat", json={"message": "Capital of France?"})
+        assert response.status_code == 200
+        assert response.json()["conversation_id"]
+    
+    def test_chat_reuses_conversation_id(self, client, mock_ollama):
+        response = client.post("/chat", json={"message": "Capital of France?",
+                                              "conversation_id": "abc"})
+        assert response.json()["conversation_id"] == "abc"
+        results = api_server.search_index.search("capital")
+        assert {r["conversation_id"] for r in results} == {"abc"}
+    
+    def test_chat_survives_index_failure(self, client, mock_ollama, monkeypatch):
+        index = Mock()
+        index.add_messages.side_effect = sqlite3.OperationalError("database is locked")
+        monkeypatch.setattr(api_server, "search_index", index)
+        response = client.post("/chat", json={"message": "Capital of France?"})
+        assert response.status_code == 200
+        assert response.json()["message"] == "Paris is the capital."
+
+
+class TestSearchEndpoint:
+    
+    def test_search(self, client, mock_ollama):
+        client.post("/chat", json={"message": "Capital of France?"})
+        response = client.get("/search", params={"q": "france"})
+        assert response.status_code == 200
+        assert len(response.json()["results"]) == 1
+    
+    @pytest.mark.parametrize("limit", [-1, 0, 101])
+    def test_search_limit_bounds(self, client, limit):
+        response = client.get("/search", params={"q": "france", "limit": limit})
+        assert response.status_code == 422
+
+
+class TestEmbedEndpoint:
+    
+    def test_embed_float(self, client, use_embedder):
+        use_embedder(lambda model, texts: [[0.1, 0.5] for _ in texts])
+        response = client.post("/embed", json={"input": "hello"})
+        assert response.status_code == 200
+        assert response.json() == {"embedding": [0.1, 0.5], "model": "nomic-embed-text",
+                                   "success": True}
+    
+    def test_embed_base64(self, client, use_embedder):
+        use_embedder(lambda model, texts: [[0.1, 0.5] for _ in texts])
+        response = client.post("/embed", json={"input": "hello", "encoding_format": "base64"})
+        assert response.status_code == 200
+        decoded = struct.unpack("<2f", base64.b64decode(response.json()["embedding"]))
+        assert decoded == struct.unpack("<2f", struct.pack("<2f", 0.1, 0.5))
+    
+    def test_embed_invalid_encoding_format(self, client):
+        response = client.post("/embed", json={"input": "hello", "encoding_format": "int8"})
+        assert response.status_code == 422
+    
+    def test_embed_upstream_failure(self, client, use_embedder):
+        def failing(model, texts):
+            raise ConnectionError("upstream down")
+        use_embedder(failing)
+        response = client.post("/embed", json={"input": "hello"})
+        assert response.status_code == 500
+        assert "upstream down" in response.json()["detail"]
+    
+    def test_embed_timeout(self, client, use_embedder):
+        def slow(model, texts):
+            time.sleep(0.5)
+            return [[1.0] for _ in texts]
+        use_embedder(slow, timeout=0.05)
+        response = client.post("/embed", json={"input": "hello"})
+        assert response.status_code == 504
+        assert "timed out" in response.json()["detail"]
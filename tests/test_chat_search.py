@@ -0,0 +1,91 @@
+import sqlite3
+from unittest.mock import Mock, patch
+import chat_search
+from chat_search import ChatSearchIndex
+from ollama_backend import OllamaBackend
+
+
+class TestChatSearchIndex:
+    
+    def test_search_finds_message(self):
+        index = ChatSearchIndex()
+        index.add_message("c1", "user", "How do I reverse a list in Python?")
+        index.add_message("c2", "user", "What is the capital of France?")
+        results = index.search("python list")
+        assert len(results) == 1
+        assert results[0]["conversation_id"] == "c1"
+        assert "[Python]" in results[0]["snippet"]
+    
+    def test_search_ranks_best_match_first(self):
+        index = ChatSearchIndex()
+        index.add_messages("c1", [
+            {"role": "user", "content": "docker compose volumes and networks for a long running service"},
+            {"role": "assistant", "content": "docker docker docker"}
+        ])
+        results = index.search("docker")
+        assert results[0]["role"] == "assistant"
+    
+    def test_search_handles_special_characters(self):
+        index = ChatSearchIndex()
+        index.add_message("c1", "user", "what's the answer")
+        assert len(index.search('what\'s "the" (')) == 1
+        assert index.search("   ") == []
+    
+    def test_search_limit(self):
+        index = ChatSearchIndex()
+        for i in range(20):
+            index.add_message("c1", "user", f"message number {i}")
+        assert len(index.search("message", limit=5)) == 5
+    
+    def test_search_negative_limit_is_clamped(self):
+        index = ChatSearchIndex()
+        for i in range(5):
+            index.add_message("c1", "user", f"message number {i}")
+        assert len(index.search("message", limit=-1)) == 1
+    
+    def test_search_ignores_stopwords(self):
+        index = ChatSearchIndex()
+        index.add_message("c1", "user", "python generators")
+        assert len(index.search("what is the python")) == 1
+        assert index.search("the") == []
+    
+    def test_common_term_returns_newest_first(self, monkeypatch):
+        monkeypatch.setattr(chat_search, "COMMON_TERM_DOCS", 3)
+        index = ChatSearchIndex()
+        for i in range(5):
+            index.add_message(f"c{i}", "user", f"python tip {i}")
+        results = index.search("python", limit=2)
+        assert [r["conversation_id"] for r in results] == ["c4", "c3"]
+        assert results[0]["score"] is None
+
+
+class TestBackendIndexing:
+    
+    @patch('ollama_backend.requests.post')
+    def test_send_message_indexes_turn(self, mock_post):
+        mock_post.return_value.json.return_value = {
+            "message": {"content": "Paris is the capital."}
+        }
+        index = ChatSearchIndex()
+        backend = OllamaBackend(model="llama3.2", search_index=index)
+        backend.send_message("Capital of France?")
+        results = index.search("capital")
+        assert len(results) == 2
+        assert all(r["conversation_id"] == backend.conversation_id for r in results)
+    
+    def test_clear_history_starts_new_conversation(self):
+        backend = OllamaBackend(model="llama3.2")
+        old_id = backend.conversation_id
+        backend.clear_history()
+        assert backend.conversation_id != old_id
+    
+    @patch('ollama_backend.requests.post')
+    def test_index_failure_keeps_reply(self, mock_post):
+        mock_post.return_value.json.return_value = {
+            "message": {"content": "Paris is the capital."}
+        }
+        index = Mock()
+        index.add_messages.side_effect = sqlite3.OperationalError("database is locked")
+        backend = OllamaBackend(model="llama3.2", search_index=index)
+        assert backend.send_message("Capital of France?") == "Paris is the capital."
+        assert len(backend.chat_history) == 2
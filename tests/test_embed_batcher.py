@@ -0,0 +1,113 @@
+import base64
+import json
+import struct
+import threading
+import time
+from array import array
+import pytest
+from embed_batcher import Embedding, EmbeddingBatcher
+
+
+class FakeEmbedder:
+    
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+    
+    def __call__(self, model, texts):
+        with self.lock:
+            self.calls.append((model, list(texts)))
+        return [[float(len(t)), 0.5] for t in texts]
+
+
+class TestEmbeddingBatcher:
+    
+    def test_embed_single(self):
+        fake = FakeEmbedder()
+        batcher = EmbeddingBatcher(fake, batch_window=0)
+        assert batcher.embed("abc", "m").vector.tolist() == [3.0, 0.5]
+        assert fake.calls == [("m", ["abc"])]
+    
+    def test_concurrent_requests_are_batched(self):
+        fake = FakeEmbedder()
+        batcher = EmbeddingBatcher(fake, batch_window=0.2, max_batch_size=8)
+        results = {}
+        
+        def worker(i):
+            results[i] = batcher.embed("x" * i, "m").vector.tolist()
+        
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(1, 9)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert results == {i: [float(i), 0.5] for i in range(1, 9)}
+        assert len(fake.calls) < 8
+        assert all(len(texts) <= 8 for _, texts in fake.calls)
+    
+    def test_cache_by_content(self):
+        fake = FakeEmbedder()
+        batcher = EmbeddingBatcher(fake, batch_window=0)
+        batcher.embed("hello", "m")
+        batcher.embed("hello", "m")
+        batcher.embed("hello", "other")
+        assert len(fake.calls) == 2
+    
+    def test_upstream_error_propagates(self):
+        def failing(model, texts):
+            raise ConnectionError("upstream down")
+        batcher = EmbeddingBatcher(failing, batch_window=0)
+        with pytest.raises(RuntimeError, match="upstream down"):
+            batcher.embed("hello", "m")
+    
+    def test_bad_vector_does_not_kill_worker(self):
+        responses = [[[None]], [[1.0, 2.0]]]
+        batcher = EmbeddingBatcher(lambda model, texts: responses.pop(0),
+                                   batch_window=0, timeout=5)
+        with pytest.raises(RuntimeError):
+            batcher.embed("hello", "m")
+        assert batcher.embed("hello", "m").vector.tolist() == [1.0, 2.0]
+    
+    def test_each_caller_gets_own_exception(self):
+        def failing(model, texts):
+            raise ConnectionError("upstream down")
+        batcher = EmbeddingBatcher(failing, batch_window=0.2, max_batch_size=2)
+        errors = []
+        
+        def worker(text):
+            try:
+                batcher.embed(text, "m")
+            except RuntimeError as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(t,)) for t in ("a", "b")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(errors) == 2
+        assert errors[0] is not errors[1]
+    
+    def test_encode_base64(self):
+        batcher = EmbeddingBatcher(FakeEmbedder(), batch_window=0)
+        embedding = batcher.embed("ab", "m")
+        encoded = json.loads(embedding.to_json("base64"))
+        assert struct.unpack("<2f", base64.b64decode(encoded)) == (2.0, 0.5)
+        assert json.loads(embedding.to_json()) == [2.0, 0.5]
+    
+    def test_encode_float_is_compact(self):
+        embedding = Embedding(array("f", [0.1, 1 / 3, -2.5e-8]))
+        assert embedding.to_json() == "[0.1, 0.33333334, -2.5e-08]"
+    
+    def test_cache_hit_reuses_encoding(self):
+        batcher = EmbeddingBatcher(FakeEmbedder(), batch_window=0)
+        assert batcher.embed("hello", "m") is batcher.embed("hello", "m")
+    
+    def test_timeout(self):
+        def slow(model, texts):
+            time.sleep(0.5)
+            return [[1.0] for _ in texts]
+        batcher = EmbeddingBatcher(slow, batch_window=0, timeout=0.05)
+        with pytest.raises(TimeoutError, match="timed out"):
+            batcher.embed("hello", "m")